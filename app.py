@@ -1,15 +1,27 @@
 
 from flask import Flask, request, jsonify, send_file, render_template_string
 from flask_cors import CORS
-import yt_dlp
 import os
 import uuid
 import threading
 import time
 from datetime import datetime, timedelta
-import requests
 from werkzeug.utils import secure_filename
 import functools
+import hashlib
+import hmac
+import json
+import math
+import subprocess
+import glob
+import sys
+import contextlib
+import weakref
+import socket
+import ipaddress
+from urllib.parse import urlparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 app = Flask(__name__)
 CORS(app)
@@ -26,12 +38,227 @@ DEVELOPMENT_MODE = True
 RAPIDAPI_KEY = os.environ.get('RAPIDAPI_KEY', 'your-rapidapi-key')
 RAPIDAPI_HOST = os.environ.get('RAPIDAPI_HOST', 'youtube-to-mp3-converter.p.rapidapi.com')
 
+# Webhook Configuration
+WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET', '')
+WEBHOOK_MAX_WORKERS = int(os.environ.get('WEBHOOK_MAX_WORKERS', 4))
+WEBHOOK_MAX_RETRIES = 3
+WEBHOOK_BACKOFF_SECONDS = 1
+WEBHOOK_TIMEOUT_SECONDS = 10
+# Hosts that may receive webhooks even if they resolve to a private address
+WEBHOOK_ALLOWED_HOSTS = {host.strip().lower() for host in os.environ.get('WEBHOOK_ALLOWED_HOSTS', '').split(',') if host.strip()}
+
+# Audio post-processing Configuration
+FFMPEG_LOCATION = os.environ.get('FFMPEG_BINARY')
+FFMPEG_BINARY = FFMPEG_LOCATION or 'ffmpeg'
+THUMBNAIL_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+# Bitrates in kbps accepted by the quality parameter
+ALLOWED_QUALITIES = ('128', '192', '320')
+# Single-pass EBU R128 loudness normalization target
+LOUDNORM_FILTER = 'loudnorm=I=-16:TP=-1.5:LRA=11'
+
+# Tracing and profiling Configuration
+TRACE_ALL_JOBS = os.environ.get('TRACE_JOBS', '').lower() in ('1', 'true', 'yes')
+SLOW_JOB_THRESHOLD_SECONDS = float(os.environ.get('SLOW_JOB_THRESHOLD_SECONDS', 60))
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.01
+PROFILE_TOP_STACKS = 20
+PROFILE_MAX_STACK_DEPTH = 32
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+# Sampling profiler state, can be toggled at runtime via /api/admin/profiling
+profiling_enabled = os.environ.get('PROFILE_JOBS', '').lower() in ('1', 'true', 'yes')
+
+# Import yt_dlp in a background thread at startup so the first job does not pay for it
+WARM_YT_DLP = os.environ.get('WARM_YT_DLP', '1').lower() in ('1', 'true', 'yes')
+
 # Ensure upload folder exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Maximum number of task IDs accepted by /api/status/batch
+MAX_BATCH_STATUS_IDS = 100
+
 # Store download status
 download_status = {}
 
+# Video metadata keyed by video ID, shared by every task converting that video.
+# Entries are dropped automatically once no task record references them.
+video_metadata = weakref.WeakValueDictionary()
+video_metadata_lock = threading.Lock()
+
+class VideoMetadata:
+    """Metadata stored once per video"""
+    __slots__ = ('title', 'duration', 'thumbnail', 'uploader', 'upload_date', 'view_count', '__weakref__')
+
+    def __init__(self, video_info):
+        self.update(video_info)
+
+    def update(self, video_info):
+        """Refresh the fields from a new extraction"""
+        self.title = video_info['title']
+        self.duration = video_info.get('duration', 0)
+        self.thumbnail = video_info.get('thumbnail', '')
+        self.uploader = video_info.get('uploader', '')
+        self.upload_date = video_info.get('upload_date', '')
+        self.view_count = video_info.get('view_count', 0)
+
+class TaskRecord:
+    """Compact status record for a single conversion task"""
+    __slots__ = ('status', 'progress', 'filename', 'file_size', 'metadata', 'message', 'trace')
+
+    def __init__(self, status, progress=0, filename=None, file_size=None, metadata=None, message=None):
+        self.status = status
+        self.progress = progress
+        self.filename = filename
+        self.file_size = file_size
+        self.metadata = metadata
+        self.message = message
+        self.trace = None
+
+    def to_dict(self):
+        """Build the status payload returned by the status endpoints"""
+        if self.status == 'error':
+            data = {'status': 'error', 'message': self.message}
+            if self.trace is not None:
+                data['trace'] = self.trace
+            return data
+
+        data = {'status': self.status, 'progress': self.progress}
+        if self.status == 'completed':
+            metadata = self.metadata
+            data.update({
+                'filename': self.filename,
+                'title': metadata.title,
+                'download_url': f'/api/download/{self.filename}',
+                'file_size': self.file_size,
+                'file_size_mb': round(self.file_size / (1024 * 1024), 2),
+                'duration': metadata.duration,
+                'thumbnail': metadata.thumbnail,
+                'uploader': metadata.uploader,
+                'upload_date': metadata.upload_date,
+                'view_count': metadata.view_count
+            })
+        if self.trace is not None:
+            data['trace'] = self.trace
+        return data
+
+class JobTrace:
+    """Span timings for the stages of a conversion job"""
+    __slots__ = ('started', 'spans', 'profile')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = []
+        self.profile = None
+
+    def add_span(self, name, start, end):
+        self.spans.append((name, start - self.started, end - start))
+
+    @contextlib.contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, time.perf_counter())
+
+    def total_seconds(self):
+        return time.perf_counter() - self.started
+
+    def to_dict(self, include_profile=False):
+        data = {
+            'total_ms': round(self.total_seconds() * 1000, 1),
+            'spans': [
+                {'name': name, 'start_ms': round(offset * 1000, 1), 'duration_ms': round(duration * 1000, 1)}
+                for name, offset, duration in self.spans
+            ]
+        }
+        if include_profile and self.profile is not None:
+            data['profile'] = self.profile
+        return data
+
+class SamplingProfiler:
+    """Periodically sample the stack of one thread and count collapsed call stacks"""
+
+    def __init__(self, thread_id, interval=PROFILE_SAMPLE_INTERVAL_SECONDS):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            # Collapse the stack outermost-first so callers show which stage was running
+            stack = []
+            while frame is not None and len(stack) < PROFILE_MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})')
+                frame = frame.f_back
+            self.samples[';'.join(reversed(stack))] += 1
+            self.sample_count += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and return the most frequently sampled stacks"""
+        self._stop.set()
+        self._thread.join()
+        return {
+            'interval_ms': self.interval * 1000,
+            'samples': self.sample_count,
+            'top_stacks': [
+                {'stack': stack, 'samples': count}
+                for stack, count in self.samples.most_common(PROFILE_TOP_STACKS)
+            ]
+        }
+
+# Pooled HTTP session (created on first use) and bounded worker pool for webhook delivery
+webhook_session = None
+webhook_session_lock = threading.Lock()
+webhook_executor = ThreadPoolExecutor(max_workers=WEBHOOK_MAX_WORKERS, thread_name_prefix='webhook')
+
+def load_yt_dlp():
+    """Import yt_dlp on first use - its extractor registry makes the import slow"""
+    import yt_dlp
+    return yt_dlp
+
+def warm_up_yt_dlp():
+    """Import yt_dlp and its extractor classes ahead of the first job"""
+    start = time.perf_counter()
+    yt_dlp = load_yt_dlp()
+    yt_dlp.extractor.gen_extractor_classes()
+    print(f"yt_dlp warmed up in {time.perf_counter() - start:.2f}s")
+
+def get_webhook_session():
+    """Return the shared webhook session, creating it on first use"""
+    global webhook_session
+    with webhook_session_lock:
+        if webhook_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=WEBHOOK_MAX_WORKERS, pool_maxsize=WEBHOOK_MAX_WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            webhook_session = session
+    return webhook_session
+
+def store_video_metadata(video_id, video_info):
+    """Return the shared metadata for a video, refreshed from video_info"""
+    with video_metadata_lock:
+        metadata = video_metadata.get(video_id)
+        if metadata is None:
+            metadata = VideoMetadata(video_info)
+            video_metadata[video_id] = metadata
+        else:
+            metadata.update(video_info)
+    return metadata
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -78,22 +305,202 @@ def validate_rapidapi_request(f):
         return f(*args, **kwargs)
     return decorated_function
 
-def download_and_convert(video_url, task_id):
+def sign_webhook_payload(body):
+    """Return the HMAC-SHA256 signature header value for a webhook body"""
+    digest = hmac.new(WEBHOOK_SECRET.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return f'sha256={digest}'
+
+def validate_callback_url(callback_url):
+    """Return an error message if callback_url must not receive webhooks, otherwise None"""
+    invalid_message = 'callback_url must be an http:// or https:// URL'
+    if not isinstance(callback_url, str):
+        return invalid_message
+    try:
+        parsed = urlparse(callback_url)
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    except ValueError:
+        return invalid_message
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        return invalid_message
+    
+    host = parsed.hostname.lower()
+    if DEVELOPMENT_MODE or host in WEBHOOK_ALLOWED_HOSTS:
+        return None
+    
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError):
+        return f'callback_url host {host} could not be resolved'
+    
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split('%', 1)[0])
+        if (ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved
+                or ip.is_multicast or ip.is_unspecified):
+            return f'callback_url host {host} resolves to a non-public address'
+    return None
+
+def deliver_webhook(callback_url, task_id, body, attempt=0):
+    """POST a webhook body, scheduling a retry with exponential backoff on failure"""
+    import requests
+    
+    # Check again at delivery time in case the host now resolves elsewhere
+    error = validate_callback_url(callback_url)
+    if error:
+        print(f"Webhook for {task_id} not delivered: {error}")
+        return
+    
+    session = get_webhook_session()
+    headers = {
+        'Content-Type': 'application/json',
+        'X-Webhook-Task-Id': task_id
+    }
+    if WEBHOOK_SECRET:
+        headers['X-Webhook-Signature'] = sign_webhook_payload(body)
+
+    try:
+        response = session.post(callback_url, data=body, headers=headers,
+                                timeout=WEBHOOK_TIMEOUT_SECONDS, allow_redirects=False)
+        # Client errors other than rate limiting will not succeed on retry
+        if response.status_code < 500 and response.status_code != 429:
+            if response.status_code >= 300:
+                print(f"Webhook for {task_id} rejected with status {response.status_code}")
+            return
+        error = f'status {response.status_code}'
+    except requests.RequestException as e:
+        error = str(e)
+
+    if attempt < WEBHOOK_MAX_RETRIES:
+        # Wait on a timer rather than in the executor so other deliveries are not held up
+        retry = threading.Timer(WEBHOOK_BACKOFF_SECONDS * (2 ** attempt), webhook_executor.submit,
+                                args=(deliver_webhook, callback_url, task_id, body, attempt + 1))
+        retry.daemon = True
+        retry.start()
+    else:
+        print(f"Webhook for {task_id} failed after {WEBHOOK_MAX_RETRIES + 1} attempts: {error}")
+
+def notify_webhook(task_id, callback_url):
+    """Queue delivery of the final task status to callback_url"""
+    body = json.dumps(build_status_response(task_id, download_status[task_id])).encode('utf-8')
+    webhook_executor.submit(deliver_webhook, callback_url, task_id, body)
+
+def parse_bool(value):
+    """Parse a boolean parameter from JSON or form data"""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+def parse_audio_options(data):
+    """Parse optional post-processing parameters, raising ValueError on invalid input"""
+    audio_options = {}
+
+    for key in ('start', 'end'):
+        value = data.get(key)
+        if value in (None, ''):
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'{key} must be a number of seconds')
+        if not math.isfinite(seconds):
+            raise ValueError(f'{key} must be a finite number of seconds')
+        if seconds < 0:
+            raise ValueError(f'{key} must not be negative')
+        audio_options[key] = seconds
+
+    if 'end' in audio_options and audio_options['end'] <= audio_options.get('start', 0):
+        raise ValueError('end must be greater than start')
+
+    if parse_bool(data.get('normalize', False)):
+        audio_options['normalize'] = True
+    if parse_bool(data.get('embed_metadata', False)):
+        audio_options['embed_metadata'] = True
+
+    return audio_options
+
+def build_ffmpeg_command(input_path, output_path, quality, metadata, audio_options, cover_path=None):
+    """Compile encoding, normalization and tagging into one ffmpeg invocation"""
+    command = [FFMPEG_BINARY, '-y', '-loglevel', 'error', '-i', input_path]
+
+    if cover_path:
+        command += ['-i', cover_path, '-map', '0:a', '-map', '1:v',
+                    '-c:v', 'mjpeg', '-disposition:v', 'attached_pic',
+                    '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)']
+    else:
+        command += ['-map', '0:a']
+
+    if audio_options.get('normalize'):
+        command += ['-af', LOUDNORM_FILTER]
+
+    command += ['-c:a', 'libmp3lame', '-b:a', f'{quality}k', '-id3v2_version', '3']
+
+    if audio_options.get('embed_metadata'):
+        command += ['-metadata', f'title={metadata.title}']
+        if metadata.uploader:
+            command += ['-metadata', f'artist={metadata.uploader}']
+        if metadata.upload_date:
+            command += ['-metadata', f'date={metadata.upload_date[:4]}']
+
+    command.append(output_path)
+    return command
+
+def log_slow_job(task_id, video_url, trace):
+    """Log a job that exceeded SLOW_JOB_THRESHOLD_SECONDS as structured JSON"""
+    print(json.dumps({
+        'event': 'slow_job',
+        'task_id': task_id,
+        'video_url': video_url,
+        'status': download_status[task_id].status,
+        'threshold_seconds': SLOW_JOB_THRESHOLD_SECONDS,
+        'trace': trace.to_dict(include_profile=True)
+    }))
+
+def require_admin_token(f):
+    """Decorator to restrict admin endpoints to requests carrying ADMIN_TOKEN"""
+    @functools.wraps(f)
+    def decorated_function(*args, **kwargs):
+        # Without a configured token, admin endpoints are only open to local development servers
+        if not ADMIN_TOKEN and os.environ.get('FLASK_ENV') == 'development':
+            return f(*args, **kwargs)
+        
+        admin_token = request.headers.get('X-Admin-Token', '')
+        if not ADMIN_TOKEN or not hmac.compare_digest(admin_token.encode('utf-8'), ADMIN_TOKEN.encode('utf-8')):
+            return jsonify({
+                'error': 'Unauthorized',
+                'message': 'A valid X-Admin-Token header is required'
+            }), 401
+        
+        return f(*args, **kwargs)
+    return decorated_function
+
+def download_and_convert(video_url, task_id, callback_url=None, quality='192', audio_options=None,
+                         trace_enabled=False):
     """Download and convert YouTube video to MP3"""
+    trace = JobTrace()
+    profiler = None
+    if profiling_enabled:
+        profiler = SamplingProfiler(threading.get_ident())
+        profiler.start()
+    
     try:
-        download_status[task_id] = {'status': 'downloading', 'progress': 0}
+        download_status[task_id] = TaskRecord('downloading', progress=0)
+        
+        with trace.span('load_yt_dlp'):
+            yt_dlp = load_yt_dlp()
         
         # Extract video info
-        with yt_dlp.YoutubeDL() as ydl:
-            video_info = ydl.extract_info(url=video_url, download=False)
+        with trace.span('extract_info'):
+            with yt_dlp.YoutubeDL() as ydl:
+                video_info = ydl.extract_info(url=video_url, download=False)
         
         video_title = video_info['title']
+        video_id = video_info.get('id') or video_info['webpage_url']
+        metadata = store_video_metadata(video_id, video_info)
         # Clean filename for filesystem
         safe_title = "".join(c for c in video_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
         filename = f"{safe_title}_{task_id}.mp3"
         filepath = os.path.join(UPLOAD_FOLDER, filename)
         
-        download_status[task_id] = {'status': 'converting', 'progress': 50}
+        download_status[task_id] = TaskRecord('converting', progress=50)
         
         # Download and convert options - use a temporary filename to avoid double extensions
         temp_filename = f"{safe_title}_{task_id}"
@@ -105,18 +512,80 @@ def download_and_convert(video_url, task_id):
             'format': 'bestaudio/best',
             'keepvideo': False,
             'outtmpl': temp_filepath,
-            'postprocessors': [{
+        }
+        if FFMPEG_LOCATION:
+            options['ffmpeg_location'] = FFMPEG_LOCATION
+        
+        if audio_options:
+            # Download the source audio as-is and let a single ffmpeg pass do
+            # the encode, normalization and tagging
+            if 'start' in audio_options or 'end' in audio_options:
+                # Only fetch the requested section
+                clip_range = (audio_options.get('start', 0), audio_options.get('end', float('inf')))
+                options['download_ranges'] = yt_dlp.utils.download_range_func(None, [clip_range])
+            
+            if audio_options.get('embed_metadata') and metadata.thumbnail:
+                # Fetch the cover next to the audio; a failed fetch only leaves the tags without cover art
+                options['writethumbnail'] = True
+            
+            cover_path = None
+            try:
+                with trace.span('download'):
+                    with yt_dlp.YoutubeDL(options) as ydl:
+                        ydl.download([video_info['webpage_url']])
+                
+                for path in glob.glob(glob.escape(temp_filepath) + '.*'):
+                    if path.lower().endswith(THUMBNAIL_EXTENSIONS):
+                        cover_path = path
+                        break
+                
+                with trace.span('ffmpeg'):
+                    command = build_ffmpeg_command(temp_filepath, filepath, quality,
+                                                   metadata, audio_options, cover_path)
+                    result = subprocess.run(command, capture_output=True, text=True)
+                    if result.returncode != 0 and cover_path:
+                        # The cover image could not be used, keep the text tags only
+                        print(f"Cover art could not be embedded for {task_id}: {result.stderr.strip()}")
+                        command = build_ffmpeg_command(temp_filepath, filepath, quality,
+                                                       metadata, audio_options)
+                        result = subprocess.run(command, capture_output=True, text=True)
+            finally:
+                for path in (temp_filepath, cover_path):
+                    if path and os.path.exists(path):
+                        os.remove(path)
+            if result.returncode != 0:
+                raise RuntimeError(f'Audio post-processing failed: {result.stderr.strip()}')
+        else:
+            options['postprocessors'] = [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': 'mp3',
-                'preferredquality': '192',
+                'preferredquality': quality,
             }]
-        }
-        
-        # Download and convert
-        with yt_dlp.YoutubeDL(options) as ydl:
-            ydl.download([video_info['webpage_url']])
+            
+            # Record when the postprocessor starts to split download and ffmpeg time
+            postprocess_started = []
+            
+            def postprocessor_hook(d):
+                if d['status'] == 'started' and not postprocess_started:
+                    postprocess_started.append(time.perf_counter())
+            
+            options['postprocessor_hooks'] = [postprocessor_hook]
+            
+            # Download and convert
+            download_started = time.perf_counter()
+            try:
+                with yt_dlp.YoutubeDL(options) as ydl:
+                    ydl.download([video_info['webpage_url']])
+            finally:
+                download_finished = time.perf_counter()
+                if postprocess_started:
+                    trace.add_span('download', download_started, postprocess_started[0])
+                    trace.add_span('ffmpeg', postprocess_started[0], download_finished)
+                else:
+                    trace.add_span('download', download_started, download_finished)
         
         # Check if file was created successfully and rename to correct filename
+        finalize_started = time.perf_counter()
         actual_filepath = None
         
         # Look for the converted file (it might have .mp3 extension added by yt-dlp)
@@ -147,35 +616,40 @@ def download_and_convert(video_url, task_id):
                 import shutil
                 shutil.copy2(actual_filepath, filepath)
                 os.remove(actual_filepath)
+        trace.add_span('finalize', finalize_started, time.perf_counter())
         
         if os.path.exists(filepath):
             # Get file size
             file_size = os.path.getsize(filepath)
             
-            download_status[task_id] = {
-                'status': 'completed',
-                'progress': 100,
-                'filename': filename,
-                'title': video_title,
-                'download_url': f'/api/download/{filename}',
-                'file_size': file_size,
-                'file_size_mb': round(file_size / (1024 * 1024), 2),
-                'duration': video_info.get('duration', 0),
-                'thumbnail': video_info.get('thumbnail', ''),
-                'uploader': video_info.get('uploader', ''),
-                'upload_date': video_info.get('upload_date', ''),
-                'view_count': video_info.get('view_count', 0)
-            }
+            download_status[task_id] = TaskRecord(
+                'completed',
+                progress=100,
+                filename=filename,
+                file_size=file_size,
+                metadata=metadata
+            )
         else:
             # List files in directory for debugging
             files_in_dir = os.listdir(UPLOAD_FOLDER)
-            download_status[task_id] = {
-                'status': 'error', 
-                'message': f'File conversion failed - file not found. Files in directory: {files_in_dir}'
-            }
+            download_status[task_id] = TaskRecord(
+                'error',
+                message=f'File conversion failed - file not found. Files in directory: {files_in_dir}'
+            )
             
     except Exception as e:
-        download_status[task_id] = {'status': 'error', 'message': str(e)}
+        download_status[task_id] = TaskRecord('error', message=str(e))
+
+    if profiler is not None:
+        trace.profile = profiler.stop()
+    # Profiles stay out of task records; they are only written to the slow job log
+    if trace_enabled or TRACE_ALL_JOBS:
+        download_status[task_id].trace = trace.to_dict()
+    if trace.total_seconds() > SLOW_JOB_THRESHOLD_SECONDS:
+        log_slow_job(task_id, video_url, trace)
+
+    if callback_url:
+        notify_webhook(task_id, callback_url)
 
 @app.route('/api/convert', methods=['POST'])
 @validate_rapidapi_request
@@ -188,10 +662,15 @@ def convert_video():
             video_url = data.get('url')
             quality = data.get('quality', '192')
             format_type = data.get('format', 'mp3')
+            callback_url = data.get('callback_url')
+            trace_enabled = parse_bool(data.get('trace', False))
         else:
             video_url = request.form.get('url')
             quality = request.form.get('quality', '192')
             format_type = request.form.get('format', 'mp3')
+            callback_url = request.form.get('callback_url')
+            trace_enabled = parse_bool(request.form.get('trace', False))
+            data = request.form
         
         if not video_url:
             return jsonify({
@@ -200,7 +679,13 @@ def convert_video():
                 'parameters': {
                     'url': 'YouTube video URL (required)',
                     'quality': 'Audio quality in kbps (optional, default: 192)',
-                    'format': 'Output format (optional, default: mp3)'
+                    'format': 'Output format (optional, default: mp3)',
+                    'callback_url': 'URL to POST the final status to (optional)',
+                    'start': 'Clip start in seconds (optional)',
+                    'end': 'Clip end in seconds (optional)',
+                    'normalize': 'Apply EBU R128 loudness normalization (optional, default: false)',
+                    'embed_metadata': 'Embed ID3 tags and cover art (optional, default: false)',
+                    'trace': 'Record stage timings in the task status (optional, default: false)'
                 }
             }), 400
         
@@ -211,11 +696,35 @@ def convert_video():
                 'message': 'Please provide a valid YouTube URL'
             }), 400
         
+        callback_error = validate_callback_url(callback_url) if callback_url else None
+        if callback_error:
+            return jsonify({
+                'error': 'Invalid callback URL',
+                'message': callback_error
+            }), 400
+        
+        if str(quality) not in ALLOWED_QUALITIES:
+            return jsonify({
+                'error': 'Invalid quality',
+                'message': 'quality must be a bitrate in kbps (128, 192, 320)'
+            }), 400
+        
+        try:
+            audio_options = parse_audio_options(data)
+        except ValueError as e:
+            return jsonify({
+                'error': 'Invalid audio options',
+                'message': str(e)
+            }), 400
+        
         # Generate unique task ID
         task_id = str(uuid.uuid4())
         
         # Start download in background thread
-        thread = threading.Thread(target=download_and_convert, args=(video_url, task_id))
+        thread = threading.Thread(
+            target=download_and_convert,
+            args=(video_url, task_id, callback_url, str(quality), audio_options, trace_enabled)
+        )
         thread.daemon = True
         thread.start()
         
@@ -237,6 +746,14 @@ def convert_video():
             'message': str(e)
         }), 500
 
+def build_status_response(task_id, task):
+    """Wrap a task record in the RapidAPI status response format"""
+    return {
+        'success': task.status != 'error',
+        'task_id': task_id,
+        'data': task.to_dict()
+    }
+
 @app.route('/api/status/<task_id>', methods=['GET'])
 @validate_rapidapi_request
 def get_status(task_id):
@@ -248,16 +765,67 @@ def get_status(task_id):
             'task_id': task_id
         }), 404
     
-    status_data = download_status[task_id].copy()
+    return jsonify(build_status_response(task_id, download_status[task_id]))
+
+@app.route('/api/status/batch', methods=['POST'])
+@validate_rapidapi_request
+def get_status_batch():
+    """Get the status of several tasks in one request - RapidAPI compatible"""
+    data = request.get_json(silent=True)
+    task_ids = data.get('task_ids') if isinstance(data, dict) else None
+
+    if not isinstance(task_ids, list) or not task_ids:
+        return jsonify({
+            'error': 'Missing required parameter',
+            'message': 'task_ids must be a non-empty list of task IDs',
+            'parameters': {
+                'task_ids': f'List of task IDs (required, max {MAX_BATCH_STATUS_IDS})'
+            }
+        }), 400
+
+    if len(task_ids) > MAX_BATCH_STATUS_IDS:
+        return jsonify({
+            'error': 'Too many task IDs',
+            'message': f'A maximum of {MAX_BATCH_STATUS_IDS} task IDs can be checked per request'
+        }), 400
+
+    results = {}
+    not_found = []
+    for task_id in task_ids:
+        task = download_status.get(task_id) if isinstance(task_id, str) else None
+        if task is None:
+            not_found.append(task_id)
+        else:
+            results[task_id] = build_status_response(task_id, task)
+
+    return jsonify({
+        'success': True,
+        'count': len(results),
+        'results': results,
+        'not_found': not_found
+    })
+
+@app.route('/api/admin/profiling', methods=['GET', 'POST'])
+@require_admin_token
+def profiling_settings():
+    """Get or toggle the sampling profiler for conversion jobs"""
+    global profiling_enabled
     
-    # Add RapidAPI specific response format
-    response = {
-        'success': status_data.get('status') != 'error',
-        'task_id': task_id,
-        'data': status_data
-    }
+    if request.method == 'POST':
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or 'enabled' not in data:
+            return jsonify({
+                'error': 'Missing required parameter',
+                'message': 'enabled parameter is required'
+            }), 400
+        profiling_enabled = parse_bool(data['enabled'])
     
-    return jsonify(response)
+    return jsonify({
+        'success': True,
+        'profiling_enabled': profiling_enabled,
+        'trace_all_jobs': TRACE_ALL_JOBS,
+        'slow_job_threshold_seconds': SLOW_JOB_THRESHOLD_SECONDS
+    })
 
 @app.route('/api/download/<filename>', methods=['GET'])
 @validate_rapidapi_request
@@ -324,6 +892,39 @@ def api_info():
                         'required': False,
                         'default': 'mp3',
                         'description': 'Output format (mp3)'
+                    },
+                    'callback_url': {
+                        'type': 'string',
+                        'required': False,
+                        'description': 'URL that receives a POST with the final status when the conversion completes or fails'
+                    },
+                    'start': {
+                        'type': 'number',
+                        'required': False,
+                        'description': 'Clip start in seconds; only the requested section is downloaded'
+                    },
+                    'end': {
+                        'type': 'number',
+                        'required': False,
+                        'description': 'Clip end in seconds'
+                    },
+                    'normalize': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': False,
+                        'description': 'Apply EBU R128 loudness normalization'
+                    },
+                    'embed_metadata': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': False,
+                        'description': 'Embed ID3 title/artist/date tags and the video thumbnail as cover art'
+                    },
+                    'trace': {
+                        'type': 'boolean',
+                        'required': False,
+                        'default': False,
+                        'description': 'Record per-stage timings (extract_info, download, ffmpeg, finalize) in the task status'
                     }
                 },
                 'headers': {
@@ -342,6 +943,16 @@ def api_info():
                     }
                 }
             },
+            'POST /api/status/batch': {
+                'description': 'Check the status of several conversions in one request',
+                'parameters': {
+                    'task_ids': {
+                        'type': 'array',
+                        'required': True,
+                        'description': f'Task IDs returned from convert endpoint (max {MAX_BATCH_STATUS_IDS})'
+                    }
+                }
+            },
             'GET /api/download/{filename}': {
                 'description': 'Download converted file',
                 'parameters': {
@@ -382,6 +993,7 @@ def index():
         'endpoints': {
             'POST /api/convert': 'Convert YouTube video to MP3',
             'GET /api/status/<task_id>': 'Get conversion status',
+            'POST /api/status/batch': 'Get the status of several conversions',
             'GET /api/download/<filename>': 'Download converted file',
             'GET /api/health': 'Health check',
             'GET /api/info': 'API information and documentation',
@@ -397,6 +1009,10 @@ if __name__ == '__main__':
     # Clean up old files on startup
     cleanup_old_files()
     
+    # Load yt_dlp in the background so /api/health answers immediately
+    if WARM_YT_DLP:
+        threading.Thread(target=warm_up_yt_dlp, daemon=True).start()
+    
     # Get port from environment variable (for Railway deployment)
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -0,0 +1,65 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules the web tier must not load before the first conversion job
+HEAVY_MODULES = ['yt_dlp', 'requests']
+RUNS = 5
+# Fail if importing app.py takes longer than this (median of RUNS)
+IMPORT_BUDGET_SECONDS = float(os.environ.get('IMPORT_BUDGET_SECONDS', 1.0))
+
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app
+import_seconds = time.perf_counter() - start
+health = app.app.test_client().get('/api/health')
+print(json.dumps({
+    'import_seconds': import_seconds,
+    'health_status': health.status_code,
+    'loaded': [name for name in %r if name in sys.modules]
+}))
+""" % (HEAVY_MODULES,)
+
+def run_child(script):
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return result.stdout.strip().splitlines()[-1]
+
+def benchmark_import():
+    print("Benchmarking cold import of app.py")
+    print("=" * 40)
+
+    results = [json.loads(run_child(CHILD_SCRIPT)) for _ in range(RUNS)]
+    timings = [r['import_seconds'] for r in results]
+    median = statistics.median(timings)
+    print(f"import app: median {median:.3f}s, min {min(timings):.3f}s, max {max(timings):.3f}s")
+
+    yt_dlp_seconds = float(run_child(
+        "import time; start = time.perf_counter(); import yt_dlp; "
+        "yt_dlp.extractor.gen_extractor_classes(); print(time.perf_counter() - start)"
+    ))
+    print(f"import yt_dlp + extractors (deferred to the worker): {yt_dlp_seconds:.3f}s")
+
+    failed = False
+    loaded = sorted({name for r in results for name in r['loaded']})
+    if loaded:
+        print(f"❌ Heavy modules loaded at import time: {', '.join(loaded)}")
+        failed = True
+    if any(r['health_status'] != 200 for r in results):
+        print("❌ /api/health did not return 200")
+        failed = True
+    if median > IMPORT_BUDGET_SECONDS:
+        print(f"❌ Import time exceeds budget of {IMPORT_BUDGET_SECONDS:.2f}s")
+        failed = True
+
+    if not failed:
+        print("✅ app.py imports within budget without loading heavy modules")
+    return not failed
+
+if __name__ == "__main__":
+    sys.exit(0 if benchmark_import() else 1)
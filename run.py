@@ -1,6 +1,5 @@
 # %%
 import subprocess
-import yt_dlp
 import os
 
 # %%
@@ -9,6 +8,9 @@ import os
 def run():
     # Ask the user for the video they want to download
     video_url = input("Please enter the YouTube Video URL: ")
+
+    # Imported here as loading yt_dlp's extractors is slow
+    import yt_dlp
     
     # Download and convert to mp3 and store in downloads folder
     with yt_dlp.YoutubeDL() as ydl:
@@ -0,0 +1,75 @@
+import pytest
+
+import app
+
+
+def make_metadata(**overrides):
+    video_info = {
+        'title': 'Video Title',
+        'duration': 212,
+        'thumbnail': 'https://i.ytimg.com/vi/VIDEO_ID/maxresdefault.jpg',
+        'uploader': 'Channel Name',
+        'upload_date': '20240101',
+        'view_count': 1000
+    }
+    video_info.update(overrides)
+    return app.VideoMetadata(video_info)
+
+
+def test_parse_audio_options_defaults_to_empty():
+    assert app.parse_audio_options({}) == {}
+
+
+def test_parse_audio_options_parses_clip_and_flags():
+    options = app.parse_audio_options({'start': '10', 'end': 20.5, 'normalize': 'true', 'embed_metadata': True})
+    assert options == {'start': 10.0, 'end': 20.5, 'normalize': True, 'embed_metadata': True}
+
+
+@pytest.mark.parametrize('data', [
+    {'start': 'nan'},
+    {'end': 'inf'},
+    {'start': 'nan', 'end': 'inf'},
+    {'start': '-1'},
+    {'start': 'abc'},
+    {'end': '0'},
+    {'start': '30', 'end': '10'},
+])
+def test_parse_audio_options_rejects_invalid_ranges(data):
+    with pytest.raises(ValueError):
+        app.parse_audio_options(data)
+
+
+def test_build_ffmpeg_command_plain_encode():
+    command = app.build_ffmpeg_command('in', 'out.mp3', '192', make_metadata(), {})
+    assert command[-1] == 'out.mp3'
+    assert ['-b:a', '192k'] == command[command.index('-b:a'):command.index('-b:a') + 2]
+    assert '-af' not in command
+    assert '-metadata' not in command
+
+
+def test_build_ffmpeg_command_normalize_and_cover():
+    command = app.build_ffmpeg_command('in', 'out.mp3', '320', make_metadata(),
+                                       {'normalize': True, 'embed_metadata': True}, 'cover.jpg')
+    assert command[command.index('-af') + 1] == app.LOUDNORM_FILTER
+    assert command.count('-i') == 2
+    assert 'cover.jpg' in command
+    assert 'artist=Channel Name' in command
+    assert 'date=2024' in command
+
+
+def test_build_ffmpeg_command_skips_missing_tags():
+    metadata = make_metadata(uploader=None, upload_date=None)
+    command = app.build_ffmpeg_command('in', 'out.mp3', '192', metadata, {'embed_metadata': True})
+    assert 'title=Video Title' in command
+    assert not any(arg.startswith(('artist=', 'date=')) for arg in command)
+    assert command.count('-i') == 1
+
+
+@pytest.mark.parametrize('quality', ['0', '٣', '64', 'abc'])
+def test_convert_rejects_unsupported_quality(quality):
+    response = app.app.test_client().post('/api/convert', json={
+        'url': 'https://www.youtube.com/watch?v=VIDEO_ID',
+        'quality': quality
+    })
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid quality'
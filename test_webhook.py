@@ -0,0 +1,68 @@
+import requests
+import json
+import hashlib
+import hmac
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Start the API with the same WEBHOOK_SECRET to check signatures
+WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET', '')
+RECEIVER_PORT = 8765
+
+received = threading.Event()
+
+class WebhookReceiver(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        print(f"Webhook received for task {self.headers.get('X-Webhook-Task-Id')}")
+        print(f"Payload: {json.dumps(json.loads(body), indent=2)}")
+
+        if WEBHOOK_SECRET:
+            expected = 'sha256=' + hmac.new(WEBHOOK_SECRET.encode('utf-8'), body, hashlib.sha256).hexdigest()
+            if hmac.compare_digest(expected, self.headers.get('X-Webhook-Signature', '')):
+                print("✅ Signature is valid")
+            else:
+                print("❌ Signature mismatch")
+
+        self.send_response(200)
+        self.end_headers()
+        received.set()
+
+    def log_message(self, format, *args):
+        pass
+
+def test_webhook():
+    base_url = "http://localhost:5000"
+    test_url = "https://www.youtube.com/watch?v=ZKWndx83RwQ"
+
+    server = HTTPServer(('localhost', RECEIVER_PORT), WebhookReceiver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print("Testing convert endpoint with callback_url...")
+    try:
+        response = requests.post(
+            f"{base_url}/api/convert",
+            json={"url": test_url, "callback_url": f"http://localhost:{RECEIVER_PORT}/webhook"},
+            headers={"Content-Type": "application/json"}
+        )
+
+        print(f"Convert status: {response.status_code}")
+        print(f"Response: {response.json()}")
+
+        if response.status_code == 202:
+            print("\nWaiting for webhook...")
+            if received.wait(timeout=120):
+                print("✅ Webhook delivered successfully!")
+            else:
+                print("❌ No webhook received within 120 seconds")
+        else:
+            print(f"❌ Convert request failed: {response.text}")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    test_webhook()